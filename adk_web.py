@@ -21,6 +21,11 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from websocket_server.server import WebSocketServer
 from agents.agent_manager import AgentManager
 from utils.config import Config
@@ -41,8 +46,14 @@ class ADKWebCommand:
         self.agent_manager = None
         self.websocket_server = None
 
-    async def setup(self):
-        """Setup the ADK web system."""
+    async def setup(self, build_model: bool = True):
+        """
+        Setup the ADK web system.
+
+        Args:
+            build_model (bool): Build the AI model during setup; the
+                --info and --status commands pass False to skip the SDK import
+        """
         try:
             # Load environment variables
             load_dotenv("config.env")
@@ -59,7 +70,7 @@ class ADKWebCommand:
 
             # Initialize agent manager with ADK patterns
             self.agent_manager = AgentManager(self.config)
-            await self.agent_manager.initialize()
+            await self.agent_manager.initialize(build_model=build_model)
             logger.info("ADK Agent Manager initialized successfully")
 
             # Create WebSocket server
@@ -127,7 +138,9 @@ async def main():
     adk_web = ADKWebCommand()
 
     try:
-        await adk_web.setup()
+        # --info and --status only report metadata and return before the
+        # server starts, so they never need the AI model
+        await adk_web.setup(build_model=not (args.info or args.status))
 
         if args.info:
             info = adk_web.get_adk_info()
@@ -173,4 +186,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based event loop for lower per-callback overhead
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -6,16 +6,33 @@ agent coordination, and ensuring optimal customer support delivery.
 """
 
 import asyncio
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
-from agents.base_agent import BaseAgent, AgentResponse
+from agents.base_agent import BaseAgent, AgentResponse, ChunkCallback
 from agents.root_agent import RootAgent
 from utils.config import Config
 from utils.logger import LoggerMixin
 from utils.simple_database import SimpleDatabaseManager
 
 
+def _ns_to_iso(timestamp_ns: Optional[int]) -> Optional[str]:
+    """
+    Format an epoch timestamp in nanoseconds as an ISO 8601 string.
+
+    Args:
+        timestamp_ns (Optional[int]): Nanoseconds since the epoch
+
+    Returns:
+        Optional[str]: ISO formatted timestamp, or None if not set
+    """
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
 class AgentManager(LoggerMixin):
     """
     Agent Manager for orchestrating all customer support agents.
@@ -46,31 +63,47 @@ class AgentManager(LoggerMixin):
         self.config = config
         self.agents: Dict[str, BaseAgent] = {}
         self.root_agent: RootAgent = None
-        self.conversation_sessions: Dict[str, Dict[str, Any]] = {}
+        self.conversation_sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._session_cap = config.max_sessions
         self.database_manager: SimpleDatabaseManager = None
 
         self.log_info("Initializing Agent Manager with ADK Root Agent")
 
-    async def initialize(self):
+    async def initialize(self, build_model: bool = True):
         """
         Initialize all agents in the system following ADK patterns.
 
         This method creates and initializes the root agent and all specialized agents,
         setting up the complete multi-agent support system with ADK architecture.
+
+        Args:
+            build_model (bool): Build the AI model now, off the event loop.
+                Commands that only report metadata pass False to skip the SDK
+                import; the model is then built on first use instead.
         """
         try:
-            # Initialize database manager first
+            # Connect to the database in a worker thread (the driver blocks on
+            # network I/O) while the root agent is built on the event loop
             self.database_manager = SimpleDatabaseManager(self.config)
-            if not self.database_manager.connect():
-                self.log_warning(
-                    "Database connection failed, continuing without database functionality"
-                )
-            else:
-                self.database_manager.create_tables()
-                self.log_info("Database manager initialized successfully")
-
-            # Initialize the root agent with database access
-            self.root_agent = RootAgent(self.config)
+            database_ready = asyncio.ensure_future(
+                asyncio.to_thread(self._connect_database)
+            )
+
+            try:
+                self.root_agent = RootAgent(self.config)
+                if build_model:
+                    # Build the AI model now, also off the event loop, so a
+                    # broken SDK install or model setting fails at startup
+                    # instead of on the first customer query
+                    await self.root_agent.ensure_ai_model()
+            except BaseException:
+                # Wait for the connect to finish so it is not left running
+                # detached with its outcome never retrieved
+                await asyncio.gather(database_ready, return_exceptions=True)
+                raise
+            await database_ready
+
+            # Give the root agent database access
             self.root_agent.database_manager = self.database_manager
 
             # No specialized agents - only root agent handles everything
@@ -82,7 +115,27 @@ class AgentManager(LoggerMixin):
             self.log_error(f"Failed to initialize agents: {e}")
             raise
 
-    async def process_query(self, query: str, user_id: str = None) -> AgentResponse:
+    def _connect_database(self):
+        """
+        Connect the database manager and verify the order tables.
+
+        Runs in a worker thread during initialize(); failures are logged and
+        the system continues without database functionality.
+        """
+        if not self.database_manager.connect():
+            self.log_warning(
+                "Database connection failed, continuing without database functionality"
+            )
+        else:
+            self.database_manager.create_tables()
+            self.log_info("Database manager initialized successfully")
+
+    async def process_query(
+        self,
+        query: str,
+        user_id: str = None,
+        send_chunk: Optional[ChunkCallback] = None,
+    ) -> AgentResponse:
         """
         Process a customer query using the root agent following ADK patterns.
 
@@ -92,13 +145,17 @@ class AgentManager(LoggerMixin):
         Args:
             query (str): The customer query to process
             user_id (str): Optional user identifier for session tracking
+            send_chunk (Optional[ChunkCallback]): Optional callback that receives
+                partial response text as it is generated
 
         Returns:
             AgentResponse: The agent's response with metadata
         """
         try:
             # Use the root agent to process the query following ADK patterns
-            response = await self.root_agent.process_query(query, user_id)
+            response = await self.root_agent.process_query(
+                query, user_id, send_chunk
+            )
 
             # Get conversation state from root agent
             conversation_state = self.root_agent.get_conversation_state(user_id)
@@ -108,7 +165,7 @@ class AgentManager(LoggerMixin):
             session["last_agent"] = response.agent_type
             session["last_query"] = query
             session["last_response"] = response.response
-            session["last_timestamp"] = datetime.now()
+            session["last_timestamp_ns"] = time.time_ns()
             session["query_count"] += 1
             session["adk_conversation_state"] = conversation_state
 
@@ -138,20 +195,21 @@ class AgentManager(LoggerMixin):
         Returns:
             Tuple[BaseAgent, float]: Selected agent and confidence score
         """
+        self.log_info("Processing query: '{}'", query)
+
         agent_scores = {}
 
         # Get confidence scores from all agents
-        self.log_info(f"Processing query: '{query}'")
         for agent_type, agent in self.agents.items():
             confidence = agent.can_handle_query(query)
             agent_scores[agent_type] = confidence
-            self.log_info(f"Agent {agent_type} confidence: {confidence}")
+            self.log_info("Agent {} confidence: {}", agent_type, confidence)
 
         # Find the agent with highest confidence
         best_agent_type = max(agent_scores, key=agent_scores.get)
         best_confidence = agent_scores[best_agent_type]
         self.log_info(
-            f"Selected agent: {best_agent_type} with confidence: {best_confidence}"
+            "Selected agent: {} with confidence: {}", best_agent_type, best_confidence
         )
 
         # Apply session-based adjustments
@@ -168,19 +226,26 @@ class AgentManager(LoggerMixin):
         """
         Get or create a user session for tracking conversation state.
 
+        Sessions are kept in least-recently-used order; once the configured
+        cap is reached the oldest session is evicted to make room.
+
         Args:
             user_id (str): User identifier
 
         Returns:
             Dict[str, Any]: User session information
         """
-        if user_id not in self.conversation_sessions:
+        if user_id in self.conversation_sessions:
+            self.conversation_sessions.move_to_end(user_id)
+        else:
+            if len(self.conversation_sessions) >= self._session_cap:
+                self.conversation_sessions.popitem(last=False)
             self.conversation_sessions[user_id] = {
-                "created_at": datetime.now(),
+                "created_at_ns": time.time_ns(),
                 "last_agent": None,
                 "last_query": None,
                 "last_response": None,
-                "last_timestamp": None,
+                "last_timestamp_ns": None,
                 "query_count": 0,
                 "agent_history": [],
             }
@@ -285,14 +350,10 @@ class AgentManager(LoggerMixin):
         session = self.conversation_sessions[user_id]
         return {
             "user_id": user_id,
-            "created_at": session["created_at"].isoformat(),
+            "created_at": _ns_to_iso(session["created_at_ns"]),
             "query_count": session["query_count"],
             "last_agent": session["last_agent"],
-            "last_activity": (
-                session["last_timestamp"].isoformat()
-                if session["last_timestamp"]
-                else None
-            ),
+            "last_activity": _ns_to_iso(session["last_timestamp_ns"]),
             "agent_history": session["agent_history"],
         }
 
@@ -307,6 +368,10 @@ class AgentManager(LoggerMixin):
             del self.conversation_sessions[user_id]
             self.log_info(f"Cleared session for user {user_id}")
 
+        # Drop the root agent's per-user conversation state as well
+        if self.root_agent:
+            self.root_agent.clear_conversation_state(user_id)
+
         # Clear conversation history for all agents for this user
         for agent in self.agents.values():
             # Filter out messages for this user
@@ -358,5 +423,5 @@ class AgentManager(LoggerMixin):
             "root_agent": self.root_agent.get_adk_metadata(),
             "agent_hierarchy": self.root_agent.get_agent_hierarchy(),
             "conversation_states": len(self.root_agent.conversation_state),
-            "sub_agents": list(self.root_agent.sub_agents.keys()),
+            "sub_agents": self.root_agent.sub_agent_types,
         }
@@ -7,24 +7,28 @@ agents inherit from, following Google ADK patterns.
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
-import google.generativeai as genai
 from loguru import logger
 
 from utils.config import Config
 from utils.logger import LoggerMixin
 
 
-@dataclass
+# Async callback that receives partial response text while it is generated
+ChunkCallback = Callable[[str], Awaitable[None]]
+
+
+@dataclass(slots=True)
 class AgentResponse:
     """
     Response object for agent interactions following ADK patterns.
 
     This dataclass provides a standardized response format for all agents,
-    ensuring consistency across the multi-agent system.
+    ensuring consistency across the multi-agent system. It is slotted since
+    one is created for every query.
     """
 
     response: str
@@ -65,16 +69,23 @@ class BaseAgent(ABC, LoggerMixin):
         self.config = config
         self.agent_type = agent_type
         self.model = None
+        self._model_lock = asyncio.Lock()
+        # Caps in-flight model requests so bursts of queries queue here
+        # instead of all hitting the API at once
+        self._llm_semaphore = asyncio.Semaphore(config.max_concurrent_llm)
         self.conversation_history = []
 
-        # Initialize AI model
-        self._initialize_ai_model()
-
+        # The AI model is created by ensure_ai_model(), which AgentManager
+        # awaits during startup unless asked not to (adk_web --info/--status)
+        # and every model call awaits before use; it is not built here
+        # because the SDK import blocks and must stay off the event loop
         self.log_info(f"Base Agent '{agent_type}' initialized")
 
     def _initialize_ai_model(self):
         """Initialize the AI model for this agent."""
         try:
+            import google.generativeai as genai
+
             genai.configure(api_key=self.config.google_api_key)
             self.model = genai.GenerativeModel(
                 model_name=self.config.agent_model,
@@ -90,6 +101,18 @@ class BaseAgent(ABC, LoggerMixin):
             self.log_error(f"Failed to initialize AI model: {e}")
             raise
 
+    async def ensure_ai_model(self):
+        """
+        Initialize the AI model if it has not been created yet.
+
+        The SDK import and client setup are blocking, so they run in a worker
+        thread rather than stalling every connection on the event loop.
+        """
+        if self.model is None:
+            async with self._model_lock:
+                if self.model is None:
+                    await asyncio.to_thread(self._initialize_ai_model)
+
     @abstractmethod
     def get_system_prompt(self) -> str:
         """
@@ -114,13 +137,20 @@ class BaseAgent(ABC, LoggerMixin):
         pass
 
     @abstractmethod
-    async def process_query(self, query: str, user_id: str = None) -> AgentResponse:
+    async def process_query(
+        self,
+        query: str,
+        user_id: str = None,
+        send_chunk: Optional[ChunkCallback] = None,
+    ) -> AgentResponse:
         """
         Process a customer query.
 
         Args:
             query (str): The customer query to process
             user_id (str): Optional user identifier for session tracking
+            send_chunk (Optional[ChunkCallback]): Optional callback that receives
+                partial response text as it is generated
 
         Returns:
             AgentResponse: The agent's response with metadata
@@ -156,6 +186,10 @@ class BaseAgent(ABC, LoggerMixin):
         """
         Get response from AI model.
 
+        Uses the SDK's async API so the event loop keeps serving other
+        connections while the model request is in flight. At most
+        config.max_concurrent_llm requests run at once per agent.
+
         Args:
             prompt (str): Prompt to send to AI model
 
@@ -163,12 +197,36 @@ class BaseAgent(ABC, LoggerMixin):
             str: AI model response
         """
         try:
-            response = self.model.generate_content(prompt)
+            await self.ensure_ai_model()
+            async with self._llm_semaphore:
+                response = await self.model.generate_content_async(prompt)
             return response.text
         except Exception as e:
             self.log_error(f"Error generating AI response: {e}")
             raise
 
+    async def _stream_ai_response(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the AI model as it is generated.
+
+        Args:
+            prompt (str): Prompt to send to AI model
+
+        Yields:
+            str: Successive chunks of the AI model response
+        """
+        try:
+            await self.ensure_ai_model()
+            async with self._llm_semaphore:
+                response = await self.model.generate_content_async(
+                    prompt, stream=True
+                )
+                async for chunk in response:
+                    yield chunk.text
+        except Exception as e:
+            self.log_error(f"Error streaming AI response: {e}")
+            raise
+
     def get_capabilities(self) -> list:
         """
         Get list of agent capabilities.
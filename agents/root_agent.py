@@ -1,19 +1,93 @@
 import re
-from typing import Dict, Any
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from agents.base_agent import BaseAgent, AgentResponse
+try:
+    import re2
+except ImportError:  # google-re2 is optional; the stdlib engine is the fallback
+    re2 = None
+
+from agents.base_agent import BaseAgent, AgentResponse, ChunkCallback
 from utils.config import Config
 from utils.logger import LoggerMixin
 from utils.simple_database import SimpleDatabaseManager
 
 
+def _compile_linear(pattern: str):
+    """
+    Compile a pattern with RE2's linear-time engine when it is installed.
+
+    Only for ASCII-only patterns: RE2's \\w, \\d and \\b never match
+    non-ASCII characters, while the stdlib fallback keeps its usual Unicode
+    matching.
+
+    Args:
+        pattern (str): Regular expression using syntax both engines accept
+
+    Returns:
+        Compiled pattern object
+    """
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
+# Query parsing patterns, compiled once at import. The email and phone
+# patterns have overlapping repeats that can backtrack heavily on untrusted
+# input and only ever match ASCII, so they use RE2 when installed.
+_EMAIL_PATTERN = _compile_linear(
+    r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
+)
+_PHONE_PATTERNS = (
+    _compile_linear(r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b"),
+    _compile_linear(r"\b\d{10}\b"),
+)
+# Order numbers and names may contain non-ASCII letters ("José García",
+# "#ünïcode"), so these stay on the stdlib engine with Unicode \w.
+# Order number patterns in priority order: "order 123", "order #123" or
+# "order number 123" anywhere in the query wins over a bare "#123"
+_ORDER_NUMBER_PATTERNS = (
+    re.compile(r"order(?:\s+number)?\s+#?(\w+)", re.IGNORECASE),
+    re.compile(r"#(\w+)"),
+)
+_NAME_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"my name is (\w+\s+\w+)",
+        r"i am (\w+\s+\w+)",
+        r"call me (\w+\s+\w+)",
+        r"(\w+\s+\w+) is my name",
+    )
+)
+
+# One line per order in the model context, without the blank lines a
+# triple-quoted block would add (they cost tokens on every request)
+_ORDER_CONTEXT_ROW = (
+    "- Order {order_number}: {status} ({total_paid} {total_paid_currency}) - {created}"
+).format
+
+# Stable codes reported in AgentResponse metadata when a query fails
+_ERROR_CODES = {
+    "processing": 1,
+    "database": 2,
+}
+
+
 class RootAgent(BaseAgent, LoggerMixin):
     def __init__(self, config: Config):
         super().__init__(config, "root_agent")
         self.database_manager = None
-        self.conversation_state = {}
+        # Per-user state in least-recently-used order, capped like the
+        # AgentManager sessions so idle users do not accumulate forever
+        self.conversation_state = OrderedDict()
         self.sub_agents = {}
+        # Sub-agents are fixed at construction, so their types and the
+        # hierarchy below never need rebuilding
+        self.sub_agent_types: Tuple[str, ...] = tuple(self.sub_agents)
+        # Built on first request
+        self._hierarchy_cache: Optional[Dict[str, Any]] = None
         self.log_info("Root Agent initialized with direct database access")
 
     def get_system_prompt(self) -> str:
@@ -67,13 +141,20 @@ Remember: Customers should get information immediately without any login require
         # Root agent can handle all queries
         return 1.0
 
-    async def process_query(self, query: str, user_id: str = None) -> AgentResponse:
+    async def process_query(
+        self,
+        query: str,
+        user_id: str = None,
+        send_chunk: Optional[ChunkCallback] = None,
+    ) -> AgentResponse:
         """
         Process a customer query with direct database access.
 
         Args:
             query (str): The customer query to process
             user_id (str): Optional user identifier for session tracking
+            send_chunk (Optional[ChunkCallback]): Optional callback that receives
+                partial response text as it is generated
 
         Returns:
             AgentResponse: The agent's response with metadata
@@ -83,20 +164,45 @@ Remember: Customers should get information immediately without any login require
             self.update_conversation_state(user_id, "root_agent", query)
 
             # Handle query directly with database access
-            return await self._handle_query_with_database(query, user_id)
+            return await self._handle_query_with_database(query, user_id, send_chunk)
 
         except Exception as e:
-            self.log_error(f"Error in root agent processing: {e}")
+            self.log_error("Error in root agent processing: {}", e)
             return AgentResponse(
                 response="I apologize, but I encountered an error processing your request. Please try again.",
                 confidence=0.0,
                 agent_type="root_agent",
                 timestamp=datetime.now(),
-                metadata={"error": str(e)},
+                metadata=self._error_metadata("processing", e),
             )
 
+    def _error_metadata(self, stage: str, error: Exception) -> Dict[str, Any]:
+        """
+        Build response metadata describing a failed query.
+
+        The exception message is only included when running at DEBUG log
+        level; otherwise the metadata carries just a code and the error type.
+
+        Args:
+            stage (str): Key into _ERROR_CODES naming where the query failed
+            error (Exception): The exception that was raised
+
+        Returns:
+            Dict[str, Any]: Error metadata
+        """
+        metadata = {
+            "error_code": _ERROR_CODES[stage],
+            "error": type(error).__name__,
+        }
+        if self.config.log_level.upper() == "DEBUG":
+            metadata["error_detail"] = str(error)
+        return metadata
+
     async def _handle_query_with_database(
-        self, query: str, user_id: str
+        self,
+        query: str,
+        user_id: str,
+        send_chunk: Optional[ChunkCallback] = None,
     ) -> AgentResponse:
         """
         Handle query with direct database access.
@@ -104,6 +210,8 @@ Remember: Customers should get information immediately without any login require
         Args:
             query (str): The customer query
             user_id (str): User identifier
+            send_chunk (Optional[ChunkCallback]): Optional callback for streaming
+                general responses
 
         Returns:
             AgentResponse: Response with order data
@@ -149,7 +257,7 @@ Remember: Customers should get information immediately without any login require
                     )
 
             # Check if this is an initial order inquiry
-            if self._is_order_inquiry(query):
+            if self._is_order_inquiry(query.lower()):
                 # Set waiting state and ask for customer info
                 self._set_waiting_state(user_id)
                 return AgentResponse(
@@ -179,7 +287,9 @@ Remember: Customers should get information immediately without any login require
                 )
 
             # Handle general queries
-            response = await self._generate_general_response(query, user_id)
+            response = await self._generate_general_response(
+                query, user_id, send_chunk
+            )
             return AgentResponse(
                 response=response,
                 agent_type="root_agent",
@@ -189,39 +299,34 @@ Remember: Customers should get information immediately without any login require
             )
 
         except Exception as e:
-            self.log_error(f"Error handling query with database: {e}")
+            self.log_error("Error handling query with database: {}", e)
             return AgentResponse(
                 response="I apologize, but I'm having trouble accessing the order information right now. Please try again in a moment or contact our support team for assistance.",
                 agent_type="root_agent",
                 confidence=0.3,
                 timestamp=datetime.now(),
-                metadata={"error": str(e)},
+                metadata=self._error_metadata("database", e),
             )
 
     def _extract_order_info(self, query: str) -> Dict[str, Any]:
-        query_lower = query.lower()
-        self.log_info(f"[INFO] Extracting order info from query: {query}")
-
-        order_number_patterns = [
-            r"order\s+#?(\w+)",
-            r"order\s+number\s+#?(\w+)",
-            r"#(\w+)",
-            r"order\s+(\w+)",
-        ]
+        self.log_info("[INFO] Extracting order info from query: {}", query)
 
         order_number = None
-        for pattern in order_number_patterns:
-            match = re.search(pattern, query_lower)
+        for pattern in _ORDER_NUMBER_PATTERNS:
+            match = pattern.search(query)
             if match:
                 order_number = match.group(1).upper()
                 break
 
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
-        email_match = re.search(email_pattern, query)
+        # An email needs an "@"; the substring check is far cheaper than the
+        # regex and rules out most queries
+        email_match = _EMAIL_PATTERN.search(query) if "@" in query else None
         customer_email = email_match.group(0) if email_match else None
 
         self.log_info(
-            f"[PARSE] Extracted → order_number: {order_number}, email: {customer_email}"
+            "[PARSE] Extracted → order_number: {}, email: {}",
+            order_number,
+            customer_email,
         )
 
         return {
@@ -231,38 +336,33 @@ Remember: Customers should get information immediately without any login require
         }
 
     def _extract_customer_info(self, query: str) -> Dict[str, Any]:
-        self.log_info(f"[INFO] Parsing customer info from query: {query}")
+        self.log_info("[INFO] Parsing customer info from query: {}", query)
         customer_info = {"email": None, "phone": None, "name": None}
 
-        # Email
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
-        email_match = re.search(email_pattern, query)
+        # Email (skip the regex when there is no "@" to anchor a match)
+        email_match = _EMAIL_PATTERN.search(query) if "@" in query else None
         if email_match:
             customer_info["email"] = email_match.group(0)
 
         # Phone
-        phone_patterns = [r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b", r"\b\d{10}\b"]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, query)
+        for pattern in _PHONE_PATTERNS:
+            phone_match = pattern.search(query)
             if phone_match:
                 customer_info["phone"] = phone_match.group(0)
                 break
 
         # Name
-        name_patterns = [
-            r"my name is (\w+\s+\w+)",
-            r"i am (\w+\s+\w+)",
-            r"call me (\w+\s+\w+)",
-            r"(\w+\s+\w+) is my name",
-        ]
-        for pattern in name_patterns:
-            name_match = re.search(pattern, query.lower())
+        for pattern in _NAME_PATTERNS:
+            name_match = pattern.search(query)
             if name_match:
                 customer_info["name"] = name_match.group(1).title()
                 break
 
         self.log_info(
-            f"[PARSE] Extracted → email: {customer_info['email']} | phone: {customer_info['phone']} | name: {customer_info['name']}"
+            "[PARSE] Extracted → email: {} | phone: {} | name: {}",
+            customer_info["email"],
+            customer_info["phone"],
+            customer_info["name"],
         )
         return customer_info
 
@@ -284,33 +384,35 @@ Remember: Customers should get information immediately without any login require
             if order_info.get("order_number"):
                 order_num = order_info["order_number"]
                 self.log_info(
-                    f"[API CALL] → get_order_by_number(order_number={order_num})"
+                    "[API CALL] → get_order_by_number(order_number={})", order_num
                 )
                 order_details = await self.database_manager.get_order_by_number(
                     order_num
                 )
-                self.log_info(f"[API RESULT] ← {order_details}")
+                self.log_info("[API RESULT] ← {}", order_details)
 
                 if order_details:
                     order_data["found"] = True
                     order_data["order_details"] = order_details
-                    self.log_info(f"[SUCCESS] Found order details for {order_num}")
+                    self.log_info("[SUCCESS] Found order details for {}", order_num)
                 else:
-                    self.log_info(f"[NOT FOUND] No order found for {order_num}")
+                    self.log_info("[NOT FOUND] No order found for {}", order_num)
 
             # Search by customer email
             elif order_info.get("customer_email"):
                 email = order_info["customer_email"]
-                self.log_info(f"[API CALL] → get_orders_by_email(email={email})")
+                self.log_info("[API CALL] → get_orders_by_email(email={})", email)
                 orders = await self.database_manager.get_orders_by_email(email)
-                self.log_info(f"[API RESULT] ← {orders}")
+                self.log_info("[API RESULT] ← {}", orders)
 
                 if orders:
                     order_data["found"] = True
                     order_data["orders"] = orders
-                    self.log_info(f"[SUCCESS] Found {len(orders)} orders for {email}")
+                    self.log_info(
+                        "[SUCCESS] Found {} orders for {}", len(orders), email
+                    )
                 else:
-                    self.log_info(f"[NOT FOUND] No orders for email {email}")
+                    self.log_info("[NOT FOUND] No orders for email {}", email)
 
         except Exception as e:
             self.log_error(f"[ERROR] get_order_data exception: {e}")
@@ -333,57 +435,37 @@ Remember: Customers should get information immediately without any login require
             # Search by email
             if customer_info.get("email"):
                 email = customer_info["email"]
-                self.log_info(f"[API CALL] → get_orders_by_email(email={email})")
+                self.log_info("[API CALL] → get_orders_by_email(email={})", email)
                 orders = await self.database_manager.get_orders_by_email(email)
-                self.log_info(f"[API RESULT] ← {orders}")
+                self.log_info("[API RESULT] ← {}", orders)
 
                 if orders:
                     order_data["found"] = True
                     order_data["orders"] = orders
                     order_data["search_method"] = "email"
                     order_data["customer_name"] = orders[0].get("user_name", "Customer")
-                    self.log_info(f"[SUCCESS] Found {len(orders)} orders via email")
+                    self.log_info("[SUCCESS] Found {} orders via email", len(orders))
                 else:
-                    self.log_info(f"[NOT FOUND] No orders for email: {email}")
+                    self.log_info("[NOT FOUND] No orders for email: {}", email)
 
         except Exception as e:
             self.log_error(f"[ERROR] _get_orders_by_customer_info exception: {e}")
         return order_data
 
-    def _is_order_inquiry(self, query: str) -> bool:
+    def _is_order_inquiry(self, query_lower: str) -> bool:
         """
         Check if the query is asking about orders.
 
         Args:
-            query (str): The customer query
+            query_lower (str): The customer query, lowercased
 
         Returns:
             bool: True if it's an order inquiry
         """
-        order_keywords = [
-            "order",
-            "orders",
-            "my order",
-            "my orders",
-            "check order",
-            "check orders",
-            "order status",
-            "order history",
-            "track order",
-            "find order",
-            "find orders",
-            "show order",
-            "show orders",
-            "list order",
-            "list orders",
-            "order list",
-            "order tracking",
-            "order details",
-            "order information",
-        ]
-
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in order_keywords)
+        # Every order phrase this used to look for ("my orders", "track order",
+        # "order status", ...) contains "order", so one substring scan gives
+        # the same answer as checking each phrase
+        return "order" in query_lower
 
     def _set_waiting_state(self, user_id: str):
         """
@@ -392,11 +474,12 @@ Remember: Customers should get information immediately without any login require
         Args:
             user_id (str): User identifier
         """
-        if user_id not in self.conversation_state:
-            self.conversation_state[user_id] = {}
+        state = self.conversation_state.get(user_id)
+        if state is None:
+            state = self.conversation_state[user_id] = {}
 
-        self.conversation_state[user_id]["waiting_for_customer_info"] = True
-        self.conversation_state[user_id]["waiting_since"] = datetime.now().isoformat()
+        state["waiting_for_customer_info"] = True
+        state["waiting_since"] = datetime.now().isoformat()
 
     def _clear_waiting_state(self, user_id: str):
         """
@@ -405,9 +488,10 @@ Remember: Customers should get information immediately without any login require
         Args:
             user_id (str): User identifier
         """
-        if user_id in self.conversation_state:
-            self.conversation_state[user_id].pop("waiting_for_customer_info", None)
-            self.conversation_state[user_id].pop("waiting_since", None)
+        state = self.conversation_state.get(user_id)
+        if state is not None:
+            state.pop("waiting_for_customer_info", None)
+            state.pop("waiting_since", None)
 
     def get_conversation_state(self, user_id: str) -> Dict[str, Any]:
         """
@@ -419,44 +503,124 @@ Remember: Customers should get information immediately without any login require
         Returns:
             Dict[str, Any]: Conversation state
         """
-        return self.conversation_state.get(
-            user_id,
-            {
-                "current_agent": "root_agent",
-                "agent_history": [],
-                "conversation_start": datetime.now().isoformat(),
-                "message_count": 0,
-            },
-        )
+        state = self.conversation_state.get(user_id)
+        if state is None:
+            # Built only on a miss; a .get() default would be built every call
+            state = self._new_state(datetime.now().isoformat())
+        return state
+
+    def clear_conversation_state(self, user_id: str):
+        """
+        Clear the conversation state for a user.
+
+        Args:
+            user_id (str): User identifier
+        """
+        self.conversation_state.pop(user_id, None)
+
+    def _new_state(self, now_iso: str) -> Dict[str, Any]:
+        """
+        Build the initial conversation state for a user.
+
+        History entries record "t_ms", milliseconds since the conversation
+        started, instead of a full ISO timestamp; add it to
+        conversation_start to recover wall-clock time.
+
+        Args:
+            now_iso (str): Conversation start time as an ISO string
+
+        Returns:
+            Dict[str, Any]: Fresh conversation state
+        """
+        return {
+            "current_agent": "root_agent",
+            # Only the most recent entries are kept per user
+            "agent_history": deque(maxlen=self.config.state_history_max),
+            "conversation_start": now_iso,
+            "_start_monotonic": time.monotonic(),
+            "message_count": 0,
+        }
 
     def update_conversation_state(self, user_id: str, agent_type: str, query: str):
         """
         Update conversation state.
 
+        Touching a user's state marks it most recently used; once
+        config.max_sessions users are tracked, the least recently used
+        state is evicted to make room.
+
         Args:
             user_id (str): User identifier
             agent_type (str): The agent type that handled the query
             query (str): The customer query
         """
-        if user_id not in self.conversation_state:
-            self.conversation_state[user_id] = {
-                "current_agent": "root_agent",
-                "agent_history": [],
-                "conversation_start": datetime.now().isoformat(),
-                "message_count": 0,
-            }
+        # One lookup on the common path; insert only on a miss
+        state = self.conversation_state.get(user_id)
+        if state is None:
+            if len(self.conversation_state) >= self.config.max_sessions:
+                self.conversation_state.popitem(last=False)
+            # The wall-clock start is formatted only here, for a new
+            # conversation; history entries use monotonic offsets instead
+            state = self._new_state(datetime.now().isoformat())
+            self.conversation_state[user_id] = state
+        else:
+            self.conversation_state.move_to_end(user_id)
 
-        state = self.conversation_state[user_id]
         state["current_agent"] = agent_type
         state["agent_history"].append(
             {
                 "agent": agent_type,
-                "timestamp": datetime.now().isoformat(),
+                "t_ms": int((time.monotonic() - state["_start_monotonic"]) * 1000),
                 "query": query,
             }
         )
         state["message_count"] += 1
 
+    def get_agent_hierarchy(self) -> Dict[str, Any]:
+        """
+        Get the agent hierarchy rooted at this agent.
+
+        The sub-agents never change after construction, so the hierarchy is
+        built once and reused; callers must treat the returned dict as
+        read-only.
+
+        Returns:
+            Dict[str, Any]: Root agent and its sub-agents with capabilities
+        """
+        if self._hierarchy_cache is None:
+            self._hierarchy_cache = {
+                "agent_type": self.agent_type,
+                "capabilities": self.get_capabilities(),
+                "sub_agents": {
+                    agent_type: {
+                        "agent_type": agent.agent_type,
+                        "capabilities": agent.get_capabilities(),
+                    }
+                    for agent_type, agent in self.sub_agents.items()
+                },
+            }
+        return self._hierarchy_cache
+
+    def get_adk_metadata(self) -> Dict[str, Any]:
+        """
+        Get ADK metadata for the root agent.
+
+        Returns:
+            Dict[str, Any]: Root agent metadata
+        """
+        return {
+            "agent_type": self.agent_type,
+            "ai_model": self.config.agent_model,
+            "capabilities": self.get_capabilities(),
+            "sub_agents": self.sub_agent_types,
+            "sub_agents_count": len(self.sub_agent_types),
+            "conversation_states": len(self.conversation_state),
+            "database_connected": (
+                self.database_manager is not None
+                and self.database_manager.connection is not None
+            ),
+        }
+
     async def _generate_customer_orders_response(
         self, query: str, order_data: Dict[str, Any], customer_info: Dict[str, Any]
     ) -> str:
@@ -481,18 +645,20 @@ Remember: Customers should get information immediately without any login require
             order = order_data["orders"][0]
             return f"Hello {customer_name}! I found 1 order for you:\n\nOrder #{order['order_number']} - Status: {order['status']} - Placed on {order['created']} - Total: {order['total_paid']} {order['total_paid_currency']}"
         else:
-            response = (
+            # Collect the pieces and join once instead of growing a string
+            parts = [
                 f"Hello {customer_name}! I found {order_count} orders for you:\n\n"
+            ]
+            parts.extend(
+                f"{i}. Order #{order['order_number']} - Status: {order['status']} - Placed on {order['created']} - Total: {order['total_paid']} {order['total_paid_currency']}\n"
+                # Show first 5 orders
+                for i, order in enumerate(order_data["orders"][:5], 1)
             )
-            for i, order in enumerate(
-                order_data["orders"][:5], 1
-            ):  # Show first 5 orders
-                response += f"{i}. Order #{order['order_number']} - Status: {order['status']} - Placed on {order['created']} - Total: {order['total_paid']} {order['total_paid_currency']}\n"
 
             if order_count > 5:
-                response += f"\n... and {order_count - 5} more orders."
+                parts.append(f"\n... and {order_count - 5} more orders.")
 
-            return response
+            return "".join(parts)
 
     async def _generate_response(
         self, query: str, order_data: Dict[str, Any], user_id: str
@@ -575,12 +741,10 @@ Order Details:
 
         elif order_data["orders"]:
             context_parts.append(f"Found {len(order_data['orders'])} orders:")
-            for order in order_data["orders"][:5]:  # Show first 5 orders
-                context_parts.append(
-                    f"""
-- Order {order['order_number']}: {order['status']} ({order['total_paid']} {order['total_paid_currency']}) - {order['created']}
-"""
-                )
+            # Show first 5 orders
+            context_parts.extend(
+                _ORDER_CONTEXT_ROW(**order) for order in order_data["orders"][:5]
+            )
 
         return "\n".join(context_parts)
 
@@ -609,13 +773,21 @@ Order Details:
 
         return "I have order information available, but I'm having trouble displaying it right now. Please try again or contact our support team."
 
-    async def _generate_general_response(self, query: str, user_id: str) -> str:
+    async def _generate_general_response(
+        self, query: str, user_id: str, send_chunk: Optional[ChunkCallback] = None
+    ) -> str:
         """
         Generate response for general queries.
 
+        When send_chunk is given, the response is streamed from the model and
+        each chunk is forwarded as it arrives; the full text is still returned.
+        If the stream fails after chunks were sent, the text streamed so far is
+        returned instead of the fallback message.
+
         Args:
             query (str): The customer query
             user_id (str): User identifier
+            send_chunk (Optional[ChunkCallback]): Optional callback for streaming
 
         Returns:
             str: Generated response
@@ -635,9 +807,19 @@ Guidelines:
 Respond naturally to the customer's query.
 """
 
+        chunks = []
         try:
-            response = await self._get_ai_response(prompt)
-            return response
+            if send_chunk is None:
+                return await self._get_ai_response(prompt)
+
+            async for text in self._stream_ai_response(prompt):
+                chunks.append(text)
+                await send_chunk(text)
+            return "".join(chunks)
         except Exception as e:
             self.log_error(f"Error generating general response: {e}")
+            if chunks:
+                # The client already shows these chunks; a different fallback
+                # text would contradict them, so finish with what was sent
+                return "".join(chunks)
             return "Thank you for contacting us! How can I help you today? If you have any questions about your orders, I'd be happy to help you check your order status or history."
@@ -31,6 +31,11 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from websocket_server.server import WebSocketServer
 from agents.agent_manager import AgentManager
 from utils.config import Config
@@ -84,5 +89,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the main async function
-    asyncio.run(main())
+    # Run the main async function, on uvloop when it is installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
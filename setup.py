@@ -14,8 +14,8 @@ from pathlib import Path
 
 def check_python_version():
     """Check if Python version is compatible."""
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8 or higher is required")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required")
         print(f"   Current version: {sys.version}")
         return False
     else:
@@ -28,6 +28,7 @@ def check_dependencies():
     required_packages = [
         "google-generativeai",
         "websockets",
+        "orjson",
         "python-dotenv",
         "pydantic",
         "loguru",
@@ -25,11 +25,16 @@ class Config(BaseSettings):
     agent_model: str = Field(default="gemini-pro", env="AGENT_MODEL")
     max_tokens: int = Field(default=4096, env="MAX_TOKENS")
     temperature: float = Field(default=0.7, env="TEMPERATURE")
+    max_concurrent_llm: int = Field(default=16, env="MAX_CONCURRENT_LLM")
 
     # WebSocket Server Configuration
     websocket_host: str = Field(default="localhost", env="WEBSOCKET_HOST")
     websocket_port: int = Field(default=8765, env="WEBSOCKET_PORT")
 
+    # Session Configuration
+    max_sessions: int = Field(default=100000, env="MAX_SESSIONS")
+    state_history_max: int = Field(default=100, env="STATE_HISTORY_MAX")
+
     # Logging Configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="logs/customer_support.log", env="LOG_FILE")
@@ -44,6 +49,7 @@ class Config(BaseSettings):
     database_name: str = Field(default="dev_orders_db", env="DATABASE_NAME")
     database_user: str = Field(default="username", env="DATABASE_USER")
     database_password: str = Field(default="password", env="DATABASE_PASSWORD")
+    db_cache_ttl: float = Field(default=30.0, env="DB_CACHE_TTL")
 
     class Config:
         """Pydantic configuration for environment variable loading."""
@@ -79,6 +85,26 @@ class Config(BaseSettings):
             if self.max_tokens <= 0:
                 raise ValueError(f"Invalid max_tokens: {self.max_tokens}")
 
+            # Validate model concurrency cap
+            if self.max_concurrent_llm <= 0:
+                raise ValueError(
+                    f"Invalid max_concurrent_llm: {self.max_concurrent_llm}"
+                )
+
+            # Validate session cap
+            if self.max_sessions <= 0:
+                raise ValueError(f"Invalid max_sessions: {self.max_sessions}")
+
+            # Validate per-user routing history length
+            if self.state_history_max <= 0:
+                raise ValueError(
+                    f"Invalid state_history_max: {self.state_history_max}"
+                )
+
+            # Validate lookup cache TTL (0 disables caching)
+            if self.db_cache_ttl < 0:
+                raise ValueError(f"Invalid db_cache_ttl: {self.db_cache_ttl}")
+
             return True
 
         except Exception as e:
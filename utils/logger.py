@@ -84,6 +84,10 @@ class LoggerMixin:
 
     This mixin automatically creates a logger instance for any class
     that inherits from it, using the class name as the logger name.
+
+    Messages use loguru's brace-style templates: pass values as extra
+    arguments (``self.log_info("Found {} orders", len(orders))``) on hot
+    paths so the string is only built when the level is enabled.
     """
 
     def __init__(self, *args, **kwargs):
@@ -91,18 +95,18 @@ class LoggerMixin:
         super().__init__(*args, **kwargs)
         self.logger = get_logger(self.__class__.__name__)
 
-    def log_info(self, message: str, **kwargs):
+    def log_info(self, message: str, *args, **kwargs):
         """Log an info message."""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
 
-    def log_warning(self, message: str, **kwargs):
+    def log_warning(self, message: str, *args, **kwargs):
         """Log a warning message."""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
 
-    def log_error(self, message: str, **kwargs):
+    def log_error(self, message: str, *args, **kwargs):
         """Log an error message."""
-        self.logger.error(message, **kwargs)
+        self.logger.error(message, *args, **kwargs)
 
-    def log_debug(self, message: str, **kwargs):
+    def log_debug(self, message: str, *args, **kwargs):
         """Log a debug message."""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
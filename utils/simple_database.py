@@ -6,6 +6,8 @@ to avoid Python 3.13 compatibility issues.
 """
 
 import asyncio
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import pg8000
@@ -15,6 +17,13 @@ from utils.config import Config
 from utils.logger import LoggerMixin
 
 
+# Most lookups kept in the result cache before the oldest is evicted
+LOOKUP_CACHE_SIZE = 4096
+
+# Marks a cache miss, since None is a valid cached "not found" result
+_MISS = object()
+
+
 class SimpleDatabaseManager(LoggerMixin):
     """
     Simple Database Manager using pg8000 for direct PostgreSQL access.
@@ -31,8 +40,45 @@ class SimpleDatabaseManager(LoggerMixin):
         super().__init__()
         self.config = config
         self.connection = None
+        # Recent lookup results as key -> (expires_at, result), in LRU order
+        self._lookup_cache = OrderedDict()
         self.log_info("Simple Database Manager initialized")
 
+    def _cache_get(self, key: tuple) -> Any:
+        """
+        Get a cached lookup result if it has not expired.
+
+        Args:
+            key (tuple): Lookup kind and value, e.g. ("order", "ABC123")
+
+        Returns:
+            Any: The cached result, or _MISS if absent or expired
+        """
+        entry = self._lookup_cache.get(key)
+        if entry is None:
+            return _MISS
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._lookup_cache[key]
+            return _MISS
+        self._lookup_cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: tuple, result: Any):
+        """
+        Cache a lookup result for config.db_cache_ttl seconds.
+
+        Args:
+            key (tuple): Lookup kind and value, e.g. ("order", "ABC123")
+            result (Any): Result to cache; None caches a "not found"
+        """
+        if self.config.db_cache_ttl <= 0:
+            return
+        self._lookup_cache[key] = (time.monotonic() + self.config.db_cache_ttl, result)
+        self._lookup_cache.move_to_end(key)
+        if len(self._lookup_cache) > LOOKUP_CACHE_SIZE:
+            self._lookup_cache.popitem(last=False)
+
     def connect(self) -> bool:
         """
         Establish database connection using pg8000.
@@ -110,12 +156,20 @@ class SimpleDatabaseManager(LoggerMixin):
         """
         Get order details by order number.
 
+        Results, including "not found", are cached briefly so repeated
+        questions about the same order skip the database.
+
         Args:
             order_number (str): The order number to search for
 
         Returns:
             Optional[Dict[str, Any]]: Order details or None if not found
         """
+        cache_key = ("order", order_number)
+        cached = self._cache_get(cache_key)
+        if cached is not _MISS:
+            return cached
+
         try:
             cursor = self.connection.cursor()
             cursor.execute(
@@ -132,8 +186,9 @@ class SimpleDatabaseManager(LoggerMixin):
             row = cursor.fetchone()
             cursor.close()
 
+            order = None
             if row:
-                return {
+                order = {
                     "id": str(row[0]) if row[0] else None,
                     "order_number": row[1],
                     "user_id": row[2],
@@ -149,7 +204,8 @@ class SimpleDatabaseManager(LoggerMixin):
                     "created_at": row[12].isoformat() if row[12] else None,
                     "updated_at": row[13].isoformat() if row[13] else None,
                 }
-            return None
+            self._cache_put(cache_key, order)
+            return order
 
         except Exception as e:
             self.log_error(f"Database error getting order {order_number}: {e}")
@@ -159,12 +215,19 @@ class SimpleDatabaseManager(LoggerMixin):
         """
         Get all orders for a given customer email.
 
+        Results are cached briefly, like get_order_by_number.
+
         Args:
             email (str): Email address to search for
 
         Returns:
             List[Dict[str, Any]]: Matching orders
         """
+        cache_key = ("email", email)
+        cached = self._cache_get(cache_key)
+        if cached is not _MISS:
+            return cached
+
         try:
             cursor = self.connection.cursor()
             cursor.execute(
@@ -182,10 +245,10 @@ class SimpleDatabaseManager(LoggerMixin):
             cursor.close()
 
             self.log_info(
-                f"[DB QUERY] get_orders_by_email({email}) → {len(rows)} found"
+                "[DB QUERY] get_orders_by_email({}) → {} found", email, len(rows)
             )
 
-            return [
+            orders = [
                 {
                     "id": str(row[0]) if row[0] else None,
                     "order_number": row[1],
@@ -199,6 +262,8 @@ class SimpleDatabaseManager(LoggerMixin):
                 }
                 for row in rows
             ]
+            self._cache_put(cache_key, orders)
+            return orders
 
         except Exception as e:
             self.log_error(f"[DB ERROR] get_orders_by_email failed for {email}: {e}")
@@ -345,4 +410,5 @@ class SimpleDatabaseManager(LoggerMixin):
         """Close database connection."""
         if self.connection:
             self.connection.close()
+            self.connection = None
             self.log_info("Database connection closed")
@@ -7,11 +7,11 @@ session management.
 """
 
 import asyncio
-import json
 import uuid
 from typing import Dict, Set, Optional, Any
 from datetime import datetime
 
+import orjson
 import websockets
 from websockets.server import WebSocketServerProtocol
 from loguru import logger
@@ -21,6 +21,25 @@ from utils.logger import LoggerMixin
 from agents.agent_manager import AgentManager
 
 
+def _encode(message: Dict[str, Any]) -> str:
+    """
+    Serialize a message for a WebSocket text frame.
+
+    Uses orjson, which also handles datetime values natively. Non-string
+    dict keys are allowed, as with the stdlib encoder. The result is decoded
+    to str so clients receive text frames rather than binary ones.
+
+    Args:
+        message (Dict[str, Any]): The message to serialize
+
+    Returns:
+        str: JSON text
+    """
+    return orjson.dumps(
+        message, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 class WebSocketServer(LoggerMixin):
     """
     WebSocket Server for real-time customer support communication.
@@ -40,6 +59,9 @@ class WebSocketServer(LoggerMixin):
     - Scales well for customer support scenarios
     """
 
+    # Maximum number of undelivered messages buffered per client
+    OUTBOUND_QUEUE_SIZE = 1024
+
     def __init__(self, config: Config, agent_manager: AgentManager):
         """
         Initialize the WebSocket server.
@@ -52,6 +74,8 @@ class WebSocketServer(LoggerMixin):
         self.config = config
         self.agent_manager = agent_manager
         self.clients: Dict[str, WebSocketServerProtocol] = {}
+        self.outbound_queues: Dict[str, asyncio.Queue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
         self.user_sessions: Dict[str, Dict[str, Any]] = {}
         self.server = None
 
@@ -100,8 +124,13 @@ class WebSocketServer(LoggerMixin):
         user_id = client_id  # Use client_id as user_id for consistency
 
         try:
-            # Store client connection
+            # Store client connection and start its dedicated writer
             self.clients[client_id] = websocket
+            queue = asyncio.Queue(maxsize=self.OUTBOUND_QUEUE_SIZE)
+            self.outbound_queues[client_id] = queue
+            self.writer_tasks[client_id] = asyncio.create_task(
+                self._writer_loop(client_id, websocket, queue)
+            )
             self.log_info(f"New client connected: {client_id}")
 
             # Send welcome message
@@ -113,19 +142,19 @@ class WebSocketServer(LoggerMixin):
                 "message": "Welcome to our AI Customer Support! I'll be your assistant today. How can I help you?",
             }
 
-            await websocket.send(json.dumps(welcome_message))
+            self._enqueue(client_id, _encode(welcome_message))
 
             # Handle incoming messages
             async for message in websocket:
                 try:
                     # Parse the message
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     response = await self._process_message(data, client_id)
 
                     # Send response back to client
-                    await websocket.send(json.dumps(response))
+                    self._enqueue(client_id, _encode(response))
 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     # Handle non-JSON messages as plain text
                     text_message = {
                         "type": "message",
@@ -133,7 +162,7 @@ class WebSocketServer(LoggerMixin):
                         "timestamp": datetime.now().isoformat(),
                     }
                     response = await self._process_message(text_message, client_id)
-                    await websocket.send(json.dumps(response))
+                    self._enqueue(client_id, _encode(response))
 
                 except Exception as e:
                     self.log_error(f"Error processing message: {e}")
@@ -142,7 +171,7 @@ class WebSocketServer(LoggerMixin):
                         "message": "An error occurred while processing your message. Please try again.",
                         "timestamp": datetime.now().isoformat(),
                     }
-                    await websocket.send(json.dumps(error_response))
+                    self._enqueue(client_id, _encode(error_response))
 
         except websockets.exceptions.ConnectionClosed:
             self.log_info(f"Client disconnected: {client_id}")
@@ -154,6 +183,95 @@ class WebSocketServer(LoggerMixin):
             # Clean up client connection
             await self._cleanup_client(client_id, user_id)
 
+    def _enqueue(self, client_id: str, message_json: str):
+        """
+        Queue a serialized message for delivery to a client.
+
+        If the client's queue is full (a slow or stalled reader), the oldest
+        pending message is dropped to make room.
+
+        Args:
+            client_id (str): The client identifier
+            message_json (str): The serialized message
+        """
+        queue = self.outbound_queues.get(client_id)
+        if queue is None:
+            return
+
+        try:
+            queue.put_nowait(message_json)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(message_json)
+            self.log_warning(f"Outbound queue full for client {client_id}")
+
+    def _try_enqueue(self, client_id: str, message_json: str) -> bool:
+        """
+        Queue a serialized message only if the client's queue has room.
+
+        Unlike _enqueue, nothing already queued is ever dropped.
+
+        Args:
+            client_id (str): The client identifier
+            message_json (str): The serialized message
+
+        Returns:
+            bool: True if the message was queued
+        """
+        queue = self.outbound_queues.get(client_id)
+        if queue is None:
+            return False
+
+        try:
+            queue.put_nowait(message_json)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _writer_loop(
+        self,
+        client_id: str,
+        websocket: WebSocketServerProtocol,
+        queue: asyncio.Queue,
+    ):
+        """
+        Deliver queued messages to a client until its connection closes.
+
+        Each connection has exactly one writer, so outbound messages are sent
+        in order without allocating a task per message. If a send fails, the
+        client is dropped from the connection tables and its websocket is
+        closed, so nothing more is queued for it and its handler cleans up.
+
+        Args:
+            client_id (str): The client identifier
+            websocket (WebSocketServerProtocol): The WebSocket connection
+            queue (asyncio.Queue): The client's outbound message queue
+        """
+        try:
+            while True:
+                message_json = await queue.get()
+                await websocket.send(message_json)
+        except websockets.exceptions.ConnectionClosed:
+            self.log_info(f"Writer stopped, client disconnected: {client_id}")
+            self._remove_client(client_id)
+        except Exception as e:
+            self.log_error(f"Error sending to client {client_id}: {e}")
+            self._remove_client(client_id)
+            try:
+                await websocket.close()
+            except Exception as close_error:
+                self.log_error(f"Error closing client {client_id}: {close_error}")
+
+    def _remove_client(self, client_id: str):
+        """
+        Stop routing outbound messages to a client.
+
+        Args:
+            client_id (str): The client identifier
+        """
+        self.clients.pop(client_id, None)
+        self.outbound_queues.pop(client_id, None)
+
     async def _process_message(
         self, data: Dict[str, Any], client_id: str
     ) -> Dict[str, Any]:
@@ -200,6 +318,12 @@ class WebSocketServer(LoggerMixin):
         """
         Handle a chat message from a client.
 
+        If the message sets "stream": true, partial response text is pushed to
+        the client as "chunk" messages before the final "message" response.
+        Chunks are never dropped from the middle of a stream: once the
+        client's queue is full, no further chunks are sent for this response
+        and the client relies on the final message, which has the full text.
+
         Args:
             data (Dict[str, Any]): The message data
             client_id (str): The client identifier
@@ -218,19 +342,48 @@ class WebSocketServer(LoggerMixin):
                 "timestamp": datetime.now().isoformat(),
             }
 
+        send_chunk = None
+        if data.get("stream"):
+            streaming = True
+
+            async def send_chunk(text: str):
+                nonlocal streaming
+                if not streaming:
+                    return
+                streaming = self._try_enqueue(
+                    client_id,
+                    _encode(
+                        {
+                            "type": "chunk",
+                            "content": text,
+                            "timestamp": datetime.now().isoformat(),
+                        }
+                    ),
+                )
+                if not streaming:
+                    self.log_warning(
+                        f"Outbound queue full for client {client_id}, "
+                        "stopped streaming this response"
+                    )
+
         # Process the message with the agent manager
-        agent_response = await self.agent_manager.process_query(content, user_id)
+        agent_response = await self.agent_manager.process_query(
+            content, user_id, send_chunk
+        )
+
+        # One clock read covers the session update and the reply timestamp
+        now = datetime.now()
 
         # Update user session
         if user_id not in self.user_sessions:
             self.user_sessions[user_id] = {
                 "client_id": client_id,
-                "created_at": datetime.now(),
+                "created_at": now,
                 "message_count": 0,
             }
 
         self.user_sessions[user_id]["message_count"] += 1
-        self.user_sessions[user_id]["last_activity"] = datetime.now()
+        self.user_sessions[user_id]["last_activity"] = now
 
         # Format the response
         response = {
@@ -238,12 +391,14 @@ class WebSocketServer(LoggerMixin):
             "content": agent_response.response,
             "agent_type": agent_response.agent_type,
             "confidence": agent_response.confidence,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "metadata": agent_response.metadata,
         }
 
         self.log_info(
-            f"Processed message for user {user_id} with {agent_response.agent_type} agent"
+            "Processed message for user {} with {} agent",
+            user_id,
+            agent_response.agent_type,
         )
         return response
 
@@ -332,9 +487,13 @@ class WebSocketServer(LoggerMixin):
             client_id (str): The client identifier
             user_id (str): The user identifier
         """
-        # Remove client from active connections
-        if client_id in self.clients:
-            del self.clients[client_id]
+        # Remove client from active connections and drop undelivered messages
+        self._remove_client(client_id)
+
+        # Stop the client's writer
+        writer_task = self.writer_tasks.pop(client_id, None)
+        if writer_task:
+            writer_task.cancel()
 
         # Update user session
         if user_id in self.user_sessions:
@@ -372,26 +531,12 @@ class WebSocketServer(LoggerMixin):
             message["timestamp"] = datetime.now().isoformat()
 
         # Convert to JSON
-        message_json = json.dumps(message)
-
-        # Create a copy of clients to avoid dictionary modification during iteration
-        clients_to_broadcast = list(self.clients.items())
-
-        # Send to all clients
-        disconnected_clients = []
-        for client_id, websocket in clients_to_broadcast:
-            try:
-                await websocket.send(message_json)
-            except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.append(client_id)
-            except Exception as e:
-                self.log_error(f"Error broadcasting to client {client_id}: {e}")
-                disconnected_clients.append(client_id)
+        message_json = _encode(message)
 
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            if client_id in self.clients:
-                del self.clients[client_id]
+        # Hand the payload to each client's writer; slow clients never
+        # delay delivery to the others
+        for client_id in list(self.clients):
+            self._enqueue(client_id, message_json)
 
         self.log_info(f"Broadcasted message to {len(self.clients)} clients")
 
@@ -413,8 +558,12 @@ class WebSocketServer(LoggerMixin):
                 except Exception as e:
                     self.log_error(f"Error closing client {client_id}: {e}")
 
-            # Clear client list
+            # Clear client list and stop writers
             self.clients.clear()
+            self.outbound_queues.clear()
+            for writer_task in self.writer_tasks.values():
+                writer_task.cancel()
+            self.writer_tasks.clear()
 
             # Stop the server
             if self.server: